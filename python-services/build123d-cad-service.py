@@ -18,16 +18,22 @@ import logging
 import tempfile
 import shutil
 import hashlib
-import json
-from typing import Optional, Dict, Any, List
+import multiprocessing
+from typing import Optional, Dict, Any, List, FrozenSet
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from functools import lru_cache
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File
+import orjson
+from fastapi import FastAPI, HTTPException, BackgroundTasks, UploadFile, File, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, FileResponse, ORJSONResponse
 from pydantic import BaseModel, validator, Field
+from starlette.concurrency import run_in_threadpool
 
 # Check if build123d is available
 try:
@@ -49,7 +55,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Build123d CAD Service",
     description="Parametric CAD modeling and professional export service using build123d",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for Next.js integration
@@ -66,33 +73,97 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Binary export downloads, served as FileResponses and excluded from compression
+EXPORT_ROUTE_PREFIX = "/api/cad/export/"
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    """GZip middleware that passes binary CAD export downloads through untouched"""
+
+    async def __call__(self, scope, receive, send):
+        # Exports are FileResponses with Range/ETag support; compressing them in-process
+        # would break both and burn CPU on multi-MB STEP/STL files
+        if scope["type"] == "http" and scope["path"].startswith(EXPORT_ROUTE_PREFIX):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Compress the JSON model responses (export paths, properties, parameters)
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Global state
 cad_jobs: Dict[str, Dict[str, Any]] = {}
 output_dir = Path(tempfile.gettempdir()) / "build123d_output"
 output_dir.mkdir(exist_ok=True)
 
-# Simple in-memory cache for generated models
-model_cache: Dict[str, Dict[str, Any]] = {}
+# In-memory LRU cache for generated models
+model_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
 MAX_CACHE_SIZE = 100
 
+# OpenCascade holds the GIL while modelling, so builds run in worker processes to use every core;
+# the pool size bounds concurrent builds and queues the rest. Each worker re-imports build123d/OCP,
+# so the default is capped rather than one per core on large hosts
+MAX_CONCURRENT_BUILDS = int(os.environ.get("CAD_MAX_CONCURRENT_BUILDS", min(4, os.cpu_count() or 1)))
+build_executor: Optional[ProcessPoolExecutor] = None
+build_pool_lock = asyncio.Lock()
+build_pool_status = "starting" if BUILD123D_AVAILABLE else "disabled"
+build_pool_restarts = 0
+
+# In-flight builds keyed by cache key, so identical concurrent requests share one build
+inflight_builds: Dict[str, asyncio.Future] = {}
+
+# Export formats written by the generators and removed on cleanup
+EXPORT_FORMATS = ("step", "stl", "gltf", "brep")
+DEFAULT_EXPORT_FORMATS = frozenset({"step", "gltf", "stl"})
+
+# Shapes accepted by the primitive generation endpoint
+SUPPORTED_PRIMITIVES = frozenset({"box", "cylinder", "sphere", "cone", "torus"})
+
+# The root payload never changes at runtime, so serialize it once
+ROOT_RESPONSE_BODY = orjson.dumps({
+    "service": "build123d-cad-service",
+    "version": "1.0.0",
+    "build123d_available": BUILD123D_AVAILABLE,
+    "status": "operational"
+})
+
+# Material densities used for mass estimates (kg/m³)
+MATERIAL_DENSITIES: Dict[str, float] = {
+    "steel": 7850,
+    "aluminum": 2700,
+    "concrete": 2400,
+    "timber": 600
+}
+
 def get_cache_key(params: Dict[str, Any]) -> str:
     """Generate a cache key from parameters"""
     # Sort parameters for consistent hashing
-    param_str = json.dumps(params, sort_keys=True)
-    return hashlib.md5(param_str.encode()).hexdigest()
+    param_bytes = orjson.dumps(params, option=orjson.OPT_SORT_KEYS)
+    return hashlib.md5(param_bytes).hexdigest()
 
 def get_from_cache(cache_key: str) -> Optional[Dict[str, Any]]:
-    """Retrieve model from cache"""
-    return model_cache.get(cache_key)
+    """Retrieve model from cache, marking it as recently used"""
+    result = model_cache.get(cache_key)
+    if result is not None:
+        model_cache.move_to_end(cache_key)
+    return result
 
 def add_to_cache(cache_key: str, result: Dict[str, Any]):
     """Add model result to cache with size limit"""
-    if len(model_cache) >= MAX_CACHE_SIZE:
-        # Remove oldest entry (simple FIFO)
-        first_key = next(iter(model_cache))
-        del model_cache[first_key]
+    if cache_key in model_cache:
+        model_cache.move_to_end(cache_key)
+    elif len(model_cache) >= MAX_CACHE_SIZE:
+        # Evict the least recently used entry
+        model_cache.popitem(last=False)
     model_cache[cache_key] = result
-    logger.info(f"Cached model with key {cache_key[:8]}... (cache size: {len(model_cache)})")
+    logger.info("Cached model with key %s... (cache size: %s)", cache_key[:8], len(model_cache))
+
+def evict_model_from_cache(model_id: str):
+    """Drop cached results that point at a model whose files are being deleted"""
+    stale_keys = [key for key, result in model_cache.items() if result.get("model_id") == model_id]
+    for key in stale_keys:
+        del model_cache[key]
 
 
 # ============================================================================
@@ -163,14 +234,25 @@ def check_build123d_available():
         )
 
 
-def save_model_exports(part, base_name: str, formats: List[str]) -> Dict[str, str]:
+def warm_up_build123d():
+    """Build and measure a throwaway solid so OpenCascade initializes before the first request"""
+    try:
+        with BuildPart() as warmup:
+            Box(1, 1, 1)
+        _ = warmup.part.volume
+        logger.info("build123d kernel warmed up")
+    except Exception as e:
+        logger.warning("build123d warm-up failed: %s", e)
+
+
+def save_model_exports(part, base_name: str, formats: FrozenSet[str]) -> Dict[str, str]:
     """
     Export a build123d part to multiple formats
     
     Args:
         part: Build123d Part object
         base_name: Base filename without extension
-        formats: List of formats to export (step, gltf, stl, etc.)
+        formats: Set of formats to export (step, gltf, stl, etc.)
     
     Returns:
         Dictionary mapping format to file path
@@ -186,33 +268,47 @@ def save_model_exports(part, base_name: str, formats: List[str]) -> Dict[str, st
             step_path = str(base_path.with_suffix(".step"))
             part.export_step(step_path)
             exports["step"] = step_path
-            logger.info(f"Exported STEP: {step_path}")
+            logger.info("Exported STEP: %s", step_path)
         
         if "stl" in formats:
             stl_path = str(base_path.with_suffix(".stl"))
             part.export_stl(stl_path)
             exports["stl"] = stl_path
-            logger.info(f"Exported STL: {stl_path}")
+            logger.info("Exported STL: %s", stl_path)
         
         if "gltf" in formats:
             gltf_path = str(base_path.with_suffix(".gltf"))
             part.export_gltf(gltf_path)
             exports["gltf"] = gltf_path
-            logger.info(f"Exported GLTF: {gltf_path}")
+            logger.info("Exported GLTF: %s", gltf_path)
         
         if "brep" in formats:
             brep_path = str(base_path.with_suffix(".brep"))
             part.export_brep(brep_path)
             exports["brep"] = brep_path
-            logger.info(f"Exported BREP: {brep_path}")
+            logger.info("Exported BREP: %s", brep_path)
     
     except Exception as e:
-        logger.error(f"Export failed: {e}")
+        logger.error("Export failed: %s", e)
         raise
     
     return exports
 
 
+def delete_model_files(model_id: str) -> List[str]:
+    """Delete all exported files for a model, returning the formats removed"""
+    deleted = []
+    for format in EXPORT_FORMATS:
+        file_path = output_dir / f"{model_id}.{format}"
+        # Unlink directly rather than stat-then-unlink: one syscall per format
+        try:
+            file_path.unlink()
+        except FileNotFoundError:
+            continue
+        deleted.append(format)
+    return deleted
+
+
 def calculate_model_properties(part) -> Dict[str, Any]:
     """Calculate physical properties of a CAD model"""
     if not BUILD123D_AVAILABLE:
@@ -244,7 +340,7 @@ def calculate_model_properties(part) -> Dict[str, Any]:
             }
         }
     except Exception as e:
-        logger.error(f"Property calculation failed: {e}")
+        logger.error("Property calculation failed: %s", e)
         return {}
 
 
@@ -275,6 +371,255 @@ def generate_demo_response(model_type: str, parameters: Dict[str, Any]) -> Dict[
     }
 
 
+# ============================================================================
+# CAD Builders (blocking - run in the threadpool from async endpoints)
+# ============================================================================
+
+def build_column(params: ColumnParameters, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build and export a structural column (blocking)"""
+    # Create parametric model using build123d
+    with BuildPart() as column:
+        # Column shaft - vertical cylinder
+        Cylinder(
+            radius=params.shaft_diameter / 2,
+            height=params.height,
+            align=(Align.CENTER, Align.CENTER, Align.MIN)
+        )
+        
+        # Base plate at bottom
+        with BuildSketch(Plane.XY):
+            Rectangle(params.base_size, params.base_size, align=Align.CENTER)
+        extrude(amount=params.base_size / 10)
+        
+        # Bolt holes in base plate
+        base_face = column.faces().sort_by(Axis.Z)[0]
+        hole_pattern = PolarLocations(
+            radius=params.base_size / 3,
+            count=params.hole_count
+        )
+        for loc in hole_pattern:
+            with Locations(base_face, loc):
+                Hole(radius=params.hole_diameter / 2, depth=params.base_size / 10)
+        
+        # Capital (top plate) if requested
+        if params.add_capital:
+            with BuildSketch(Plane.XY.offset(params.height)):
+                Rectangle(params.base_size, params.base_size, align=Align.CENTER)
+            extrude(amount=params.base_size / 10)
+            
+            # Bolt holes in capital
+            top_face = column.faces().sort_by(Axis.Z)[-1]
+            for loc in hole_pattern:
+                with Locations(top_face, loc):
+                    Hole(radius=params.hole_diameter / 2, depth=params.base_size / 10)
+    
+    # Generate unique model ID
+    model_id = f"column_{uuid.uuid4().hex[:8]}"
+    
+    # Export to multiple formats
+    exports = save_model_exports(
+        column.part,
+        model_id,
+        formats=DEFAULT_EXPORT_FORMATS
+    )
+    
+    # Calculate properties
+    properties = calculate_model_properties(column.part)
+    
+    # Estimate mass based on material
+    density = MATERIAL_DENSITIES.get(params.material.lower(), 7850)
+    mass_kg = (properties["volume"] / 1e9) * density  # mm³ to m³ conversion
+    properties["mass_estimate"] = mass_kg
+    
+    logger.info("Successfully generated column %s", model_id)
+    
+    return {
+        "success": True,
+        "model_id": model_id,
+        "model_type": "structural_column",
+        "exports": exports,
+        "properties": properties,
+        "parameters": parameters,
+        "material": {
+            "type": params.material,
+            "density": density,
+            "mass_kg": mass_kg
+        }
+    }
+
+
+def build_box(params: BoxParameters, parameters: Dict[str, Any]) -> Dict[str, Any]:
+    """Build and export a box/enclosure (blocking)"""
+    with BuildPart() as box:
+        # Create outer box
+        Box(
+            params.dimensions.width,
+            params.dimensions.depth,
+            params.dimensions.height,
+            align=(Align.CENTER, Align.CENTER, Align.MIN)
+        )
+        
+        # Apply corner fillets if specified
+        if params.corner_radius:
+            edges_to_fillet = box.edges().filter_by(Axis.Z)
+            fillet(edges_to_fillet, radius=params.corner_radius)
+        
+        # Create hollow interior by shelling
+        top_face = box.faces().sort_by(Axis.Z)[-1]
+        shell(
+            faces_to_remove=[top_face] if params.has_lid else [],
+            thickness=params.wall_thickness
+        )
+        
+        # Add mounting holes if requested
+        if params.mounting_holes:
+            bottom_face = box.faces().sort_by(Axis.Z)[0]
+            hole_positions = [
+                (params.dimensions.width / 3, params.dimensions.depth / 3),
+                (-params.dimensions.width / 3, params.dimensions.depth / 3),
+                (params.dimensions.width / 3, -params.dimensions.depth / 3),
+                (-params.dimensions.width / 3, -params.dimensions.depth / 3)
+            ]
+            for x, y in hole_positions:
+                with Locations((x, y, 0)):
+                    Hole(radius=3, depth=params.wall_thickness)
+    
+    model_id = f"box_{uuid.uuid4().hex[:8]}"
+    exports = save_model_exports(box.part, model_id, formats=DEFAULT_EXPORT_FORMATS)
+    properties = calculate_model_properties(box.part)
+    
+    logger.info("Successfully generated box %s", model_id)
+    
+    return {
+        "success": True,
+        "model_id": model_id,
+        "model_type": "box_enclosure",
+        "exports": exports,
+        "properties": properties,
+        "parameters": parameters
+    }
+
+
+def build_primitive(shape: str, width: float, height: float, depth: float, radius: float) -> Dict[str, Any]:
+    """Build and export a basic primitive (blocking)"""
+    with BuildPart() as part:
+        if shape == "box":
+            Box(width, depth, height)
+        elif shape == "cylinder":
+            Cylinder(radius=radius, height=height)
+        elif shape == "sphere":
+            Sphere(radius=radius)
+        elif shape == "cone":
+            Cone(bottom_radius=radius, top_radius=radius/2, height=height)
+        elif shape == "torus":
+            Torus(major_radius=radius, minor_radius=radius/3)
+    
+    model_id = f"{shape}_{uuid.uuid4().hex[:8]}"
+    exports = save_model_exports(part.part, model_id, formats=DEFAULT_EXPORT_FORMATS)
+    properties = calculate_model_properties(part.part)
+    
+    return {
+        "success": True,
+        "model_id": model_id,
+        "model_type": f"primitive_{shape}",
+        "exports": exports,
+        "properties": properties
+    }
+
+
+def create_build_executor() -> ProcessPoolExecutor:
+    """Create the CAD build process pool"""
+    # spawn rather than fork: forking a process that already runs an event loop and threads is unsafe
+    return ProcessPoolExecutor(
+        max_workers=MAX_CONCURRENT_BUILDS,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+async def warm_build_workers():
+    """
+    Start every build worker and warm up its CAD kernel
+
+    ProcessPoolExecutor only spawns workers on submit, so one warm-up per worker
+    is submitted up front; otherwise the first builds would pay for the process
+    start, the build123d import and the kernel initialization.
+    """
+    global build_pool_status
+    loop = asyncio.get_running_loop()
+    try:
+        await asyncio.gather(*(
+            loop.run_in_executor(build_executor, warm_up_build123d)
+            for _ in range(MAX_CONCURRENT_BUILDS)
+        ))
+    except BrokenProcessPool:
+        build_pool_status = "broken"
+        raise
+    build_pool_status = "ready"
+    logger.info("Started %s CAD build worker processes", MAX_CONCURRENT_BUILDS)
+
+
+async def restart_build_executor(broken_executor: ProcessPoolExecutor):
+    """Replace a build pool whose worker died; concurrent callers restart it only once"""
+    global build_executor, build_pool_status, build_pool_restarts
+    async with build_pool_lock:
+        if build_executor is not broken_executor:
+            # Another request already replaced the pool this one saw break
+            return
+        logger.error("CAD build worker terminated abruptly; restarting the build process pool")
+        build_pool_status = "restarting"
+        broken_executor.shutdown(wait=False, cancel_futures=True)
+        build_executor = create_build_executor()
+        build_pool_restarts += 1
+        await warm_build_workers()
+
+
+async def _build_and_cache(cache_key: str, builder, *args) -> Dict[str, Any]:
+    """Run one build in the process pool and cache its result; only the leader request starts this"""
+    global build_pool_status
+    loop = asyncio.get_running_loop()
+    try:
+        executor = build_executor
+        try:
+            result = await loop.run_in_executor(executor, builder, *args)
+        except BrokenProcessPool:
+            # A worker died (e.g. OpenCascade crashing on bad geometry); restart the pool and retry once
+            await restart_build_executor(executor)
+            executor = build_executor
+            try:
+                result = await loop.run_in_executor(executor, builder, *args)
+            except BrokenProcessPool:
+                # The next build restarts the pool again
+                build_pool_status = "broken"
+                raise
+        add_to_cache(cache_key, result)
+        return result
+    finally:
+        inflight_builds.pop(cache_key, None)
+
+
+async def run_cad_build(cache_key: str, builder, *args) -> Dict[str, Any]:
+    """
+    Run a blocking CAD builder in the build process pool
+
+    Builders and their arguments are pickled to a worker process; they return
+    plain dicts of export paths and properties, so results pickle back cheaply.
+
+    Concurrent requests with the same cache key share a single in-flight build
+    instead of each generating and exporting identical geometry. The build runs
+    as a detached task, so a client disconnecting does not cancel it for the
+    other requests waiting on the same key.
+    """
+    build = inflight_builds.get(cache_key)
+    if build is None:
+        build = asyncio.ensure_future(_build_and_cache(cache_key, builder, *args))
+        inflight_builds[cache_key] = build
+        # Mark a failure as retrieved so it isn't logged again when every waiter has gone
+        build.add_done_callback(lambda task: task.cancelled() or task.exception())
+    else:
+        logger.info("Joining in-flight build (key: %s...)", cache_key[:8])
+    return await asyncio.shield(build)
+
+
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -282,12 +627,7 @@ def generate_demo_response(model_type: str, parameters: Dict[str, Any]) -> Dict[
 @app.get("/")
 async def root():
     """Service health check"""
-    return {
-        "service": "build123d-cad-service",
-        "version": "1.0.0",
-        "build123d_available": BUILD123D_AVAILABLE,
-        "status": "operational"
-    }
+    return Response(content=ROOT_RESPONSE_BODY, media_type="application/json")
 
 
 @app.get("/health")
@@ -296,10 +636,13 @@ async def health_check():
     return {
         "status": "healthy",
         "build123d_installed": BUILD123D_AVAILABLE,
-        "active_jobs": len([j for j in cad_jobs.values() if j["status"] == "processing"]),
+        "active_jobs": sum(1 for j in cad_jobs.values() if j["status"] == "processing"),
         "total_jobs": len(cad_jobs),
         "cache_size": len(model_cache),
         "cache_max_size": MAX_CACHE_SIZE,
+        "max_concurrent_builds": MAX_CONCURRENT_BUILDS,
+        "build_pool_status": build_pool_status,
+        "build_pool_restarts": build_pool_restarts,
         "output_directory": str(output_dir),
         "timestamp": datetime.now().isoformat()
     }
@@ -317,106 +660,32 @@ async def generate_column(params: ColumnParameters):
     - Accurate physical properties
     - Multiple export formats (STEP, GLTF, STL)
     """
-    logger.info(f"Generating column with params: {params.model_dump()}")
+    # Dump the parameters once and reuse them for logging, caching and the response
+    parameters = params.model_dump()
+    logger.info("Generating column with params: %s", parameters)
     
     # Check cache first
-    cache_key = get_cache_key(params.model_dump())
+    cache_key = get_cache_key(parameters)
     cached_result = get_from_cache(cache_key)
     if cached_result:
-        logger.info(f"Returning cached column model (key: {cache_key[:8]}...)")
+        logger.info("Returning cached column model (key: %s...)", cache_key[:8])
         return cached_result
     
     # Demo mode if build123d not available
     if not BUILD123D_AVAILABLE:
         logger.warning("Running in demo mode - returning mock data")
-        result = generate_demo_response("column", params.model_dump())
+        result = generate_demo_response("column", parameters)
         add_to_cache(cache_key, result)
         return result
     
     try:
-        # Create parametric model using build123d
-        with BuildPart() as column:
-            # Column shaft - vertical cylinder
-            Cylinder(
-                radius=params.shaft_diameter / 2,
-                height=params.height,
-                align=(Align.CENTER, Align.CENTER, Align.MIN)
-            )
-            
-            # Base plate at bottom
-            with BuildSketch(Plane.XY):
-                Rectangle(params.base_size, params.base_size, align=Align.CENTER)
-            extrude(amount=params.base_size / 10)
-            
-            # Bolt holes in base plate
-            base_face = column.faces().sort_by(Axis.Z)[0]
-            hole_pattern = PolarLocations(
-                radius=params.base_size / 3,
-                count=params.hole_count
-            )
-            for loc in hole_pattern:
-                with Locations(base_face, loc):
-                    Hole(radius=params.hole_diameter / 2, depth=params.base_size / 10)
-            
-            # Capital (top plate) if requested
-            if params.add_capital:
-                with BuildSketch(Plane.XY.offset(params.height)):
-                    Rectangle(params.base_size, params.base_size, align=Align.CENTER)
-                extrude(amount=params.base_size / 10)
-                
-                # Bolt holes in capital
-                top_face = column.faces().sort_by(Axis.Z)[-1]
-                for loc in hole_pattern:
-                    with Locations(top_face, loc):
-                        Hole(radius=params.hole_diameter / 2, depth=params.base_size / 10)
-        
-        # Generate unique model ID
-        model_id = f"column_{uuid.uuid4().hex[:8]}"
-        
-        # Export to multiple formats
-        exports = save_model_exports(
-            column.part,
-            model_id,
-            formats=["step", "gltf", "stl"]
-        )
-        
-        # Calculate properties
-        properties = calculate_model_properties(column.part)
-        
-        # Estimate mass based on material
-        material_densities = {
-            "steel": 7850,      # kg/m³
-            "aluminum": 2700,
-            "concrete": 2400,
-            "timber": 600
-        }
-        density = material_densities.get(params.material.lower(), 7850)
-        mass_kg = (properties["volume"] / 1e9) * density  # mm³ to m³ conversion
-        properties["mass_estimate"] = mass_kg
-        
-        logger.info(f"Successfully generated column {model_id}")
-        
-        result = {
-            "success": True,
-            "model_id": model_id,
-            "model_type": "structural_column",
-            "exports": exports,
-            "properties": properties,
-            "parameters": params.model_dump(),
-            "material": {
-                "type": params.material,
-                "density": density,
-                "mass_kg": mass_kg
-            }
-        }
-        
-        # Cache the result
-        add_to_cache(cache_key, result)
+        # OpenCascade modelling and export are CPU-bound; keep them off the event loop
+        result = await run_cad_build(cache_key, build_column, params, parameters)
         
         return result
         
     except Exception as e:
-        logger.error(f"Column generation failed: {e}", exc_info=True)
+        logger.error("Column generation failed: %s", e, exc_info=True)
         raise HTTPException(
             status_code=500,
             detail=f"CAD generation failed: {str(e)}"
@@ -435,77 +704,30 @@ async def generate_box(params: BoxParameters):
     - Optional lid
     - Optional mounting holes
     """
-    logger.info(f"Generating box with params: {params.model_dump()}")
+    # Dump the parameters once and reuse them for logging, caching and the response
+    parameters = params.model_dump()
+    logger.info("Generating box with params: %s", parameters)
     
     # Check cache first
-    cache_key = get_cache_key(params.model_dump())
+    cache_key = get_cache_key(parameters)
     cached_result = get_from_cache(cache_key)
     if cached_result:
-        logger.info(f"Returning cached box model (key: {cache_key[:8]}...)")
+        logger.info("Returning cached box model (key: %s...)", cache_key[:8])
         return cached_result
     
     if not BUILD123D_AVAILABLE:
-        result = generate_demo_response("box", params.model_dump())
+        result = generate_demo_response("box", parameters)
         add_to_cache(cache_key, result)
         return result
     
     try:
-        with BuildPart() as box:
-            # Create outer box
-            Box(
-                params.dimensions.width,
-                params.dimensions.depth,
-                params.dimensions.height,
-                align=(Align.CENTER, Align.CENTER, Align.MIN)
-            )
-            
-            # Apply corner fillets if specified
-            if params.corner_radius:
-                edges_to_fillet = box.edges().filter_by(Axis.Z)
-                fillet(edges_to_fillet, radius=params.corner_radius)
-            
-            # Create hollow interior by shelling
-            top_face = box.faces().sort_by(Axis.Z)[-1]
-            shell(
-                faces_to_remove=[top_face] if params.has_lid else [],
-                thickness=params.wall_thickness
-            )
-            
-            # Add mounting holes if requested
-            if params.mounting_holes:
-                bottom_face = box.faces().sort_by(Axis.Z)[0]
-                hole_positions = [
-                    (params.dimensions.width / 3, params.dimensions.depth / 3),
-                    (-params.dimensions.width / 3, params.dimensions.depth / 3),
-                    (params.dimensions.width / 3, -params.dimensions.depth / 3),
-                    (-params.dimensions.width / 3, -params.dimensions.depth / 3)
-                ]
-                for x, y in hole_positions:
-                    with Locations((x, y, 0)):
-                        Hole(radius=3, depth=params.wall_thickness)
-        
-        model_id = f"box_{uuid.uuid4().hex[:8]}"
-        exports = save_model_exports(box.part, model_id, formats=["step", "gltf", "stl"])
-        properties = calculate_model_properties(box.part)
-        
-        logger.info(f"Successfully generated box {model_id}")
-        
-        result = {
-            "success": True,
-            "model_id": model_id,
-            "model_type": "box_enclosure",
-            "exports": exports,
-            "properties": properties,
-            "parameters": params.model_dump()
-        }
-        
-        # Cache the result
-        add_to_cache(cache_key, result)
+        # OpenCascade modelling and export are CPU-bound; keep them off the event loop
+        result = await run_cad_build(cache_key, build_box, params, parameters)
         
         return result
         
     except Exception as e:
-        logger.error(f"Box generation failed: {e}", exc_info=True)
+        logger.error("Box generation failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Generation failed: {str(e)}")
 
 
@@ -525,38 +747,32 @@ async def generate_primitive(
         width/height/depth: Dimensions for box
         radius: Radius for cylinder/sphere/cone/torus
     """
+    # Reject unknown shapes before any cache, demo or CAD work
+    if shape not in SUPPORTED_PRIMITIVES:
+        raise HTTPException(status_code=400, detail=f"Unknown shape: {shape}")
+
+    # Primitives are pure functions of their dimensions, so share the model cache
+    cache_key = get_cache_key({
+        "shape": shape, "width": width, "height": height, "depth": depth, "radius": radius
+    })
+    cached_result = get_from_cache(cache_key)
+    if cached_result:
+        logger.info("Returning cached %s primitive (key: %s...)", shape, cache_key[:8])
+        return cached_result
+
     if not BUILD123D_AVAILABLE:
-        return generate_demo_response(shape, {"shape": shape, "radius": radius})
+        result = generate_demo_response(shape, {"shape": shape, "radius": radius})
+        add_to_cache(cache_key, result)
+        return result
     
     try:
-        with BuildPart() as part:
-            if shape == "box":
-                Box(width, depth, height)
-            elif shape == "cylinder":
-                Cylinder(radius=radius, height=height)
-            elif shape == "sphere":
-                Sphere(radius=radius)
-            elif shape == "cone":
-                Cone(bottom_radius=radius, top_radius=radius/2, height=height)
-            elif shape == "torus":
-                Torus(major_radius=radius, minor_radius=radius/3)
-            else:
-                raise HTTPException(status_code=400, detail=f"Unknown shape: {shape}")
+        # OpenCascade modelling and export are CPU-bound; keep them off the event loop
+        result = await run_cad_build(cache_key, build_primitive, shape, width, height, depth, radius)
         
-        model_id = f"{shape}_{uuid.uuid4().hex[:8]}"
-        exports = save_model_exports(part.part, model_id, formats=["step", "gltf", "stl"])
-        properties = calculate_model_properties(part.part)
-        
-        return {
-            "success": True,
-            "model_id": model_id,
-            "model_type": f"primitive_{shape}",
-            "exports": exports,
-            "properties": properties
-        }
+        return result
         
     except Exception as e:
-        logger.error(f"Primitive generation failed: {e}")
+        logger.error("Primitive generation failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 
@@ -603,12 +819,11 @@ async def get_job_status(job_id: str):
 @app.delete("/api/cad/cleanup/{model_id}")
 async def cleanup_model(model_id: str):
     """Delete generated model files"""
-    deleted = []
-    for format in ["step", "stl", "gltf", "brep"]:
-        file_path = output_dir / f"{model_id}.{format}"
-        if file_path.exists():
-            file_path.unlink()
-            deleted.append(format)
+    # Evict first so no request is handed export paths that are about to disappear
+    evict_model_from_cache(model_id)
+
+    # Filesystem deletes are blocking; run them off the event loop
+    deleted = await run_in_threadpool(delete_model_files, model_id)
     
     return {
         "success": True,
@@ -617,6 +832,27 @@ async def cleanup_model(model_id: str):
     }
 
 
+# Startup event
+@app.on_event("startup")
+async def startup_event():
+    """Start the build worker processes, warming up the CAD kernel in each"""
+    global build_executor
+    if BUILD123D_AVAILABLE:
+        build_executor = create_build_executor()
+        try:
+            await warm_build_workers()
+        except BrokenProcessPool:
+            # Keep serving; the first build restarts the pool
+            logger.error("CAD build worker terminated during warm-up")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the build worker processes"""
+    if build_executor is not None:
+        build_executor.shutdown(wait=False, cancel_futures=True)
+
+
 # ============================================================================
 # Main Entry Point
 # ============================================================================
@@ -629,9 +865,9 @@ if __name__ == "__main__":
     logger.info("="*60)
     logger.info("Build123d CAD Service for ConstructAI")
     logger.info("="*60)
-    logger.info(f"Build123d Available: {BUILD123D_AVAILABLE}")
-    logger.info(f"Output Directory: {output_dir}")
-    logger.info(f"Starting server on port {port}...")
+    logger.info("Build123d Available: %s", BUILD123D_AVAILABLE)
+    logger.info("Output Directory: %s", output_dir)
+    logger.info("Starting server on port %s...", port)
     logger.info("="*60)
     
     uvicorn.run(
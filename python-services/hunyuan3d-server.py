@@ -9,19 +9,24 @@ import sys
 import time
 import uuid
 import asyncio
+import hashlib
 import logging
 from typing import Optional, Dict, Any
 from datetime import datetime
+from collections import OrderedDict
 
 import torch
 import numpy as np
 from PIL import Image
 import cv2
+import orjson
 
-from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks
+from fastapi import FastAPI, File, UploadFile, HTTPException, BackgroundTasks, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +36,8 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Hunyuan3D-2 Service",
     description="AI-powered 2D blueprint to 3D model conversion service",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Enable CORS for Next.js integration
@@ -43,10 +49,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress blueprint analysis and conversion result JSON on the wire
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Global variables for model and job tracking
 hunyuan_model = None
+gpu_available = False
 conversion_jobs: Dict[str, Dict[str, Any]] = {}
 
+# Static format list served by /formats, serialized once with an ETag of the exact bytes sent
+SUPPORTED_FORMATS = {
+    "formats": ["obj", "gltf", "glb", "ply", "fbx"],
+    "default": "obj"
+}
+SUPPORTED_FORMATS_BODY = orjson.dumps(SUPPORTED_FORMATS, option=orjson.OPT_SORT_KEYS)
+SUPPORTED_FORMATS_ETAG = '"%s"' % hashlib.md5(SUPPORTED_FORMATS_BODY).hexdigest()
+
+# Blueprint analyses keyed by upload content hash, so identical re-uploads skip OpenCV work
+analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+MAX_ANALYSIS_CACHE_SIZE = 100
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+def add_to_analysis_cache(content_hash: str, analysis: Dict[str, Any]):
+    """Add blueprint analysis to cache with size limit"""
+    if content_hash in analysis_cache:
+        analysis_cache.move_to_end(content_hash)
+    elif len(analysis_cache) >= MAX_ANALYSIS_CACHE_SIZE:
+        # Evict the least recently used entry
+        analysis_cache.popitem(last=False)
+    analysis_cache[content_hash] = analysis
+
 class ConversionRequest(BaseModel):
     prompt: str = "A detailed 3D building model from architectural blueprint"
     style: str = "architectural"
@@ -63,13 +95,16 @@ class ConversionStatus(BaseModel):
 
 def initialize_hunyuan3d():
     """Initialize Hunyuan3D-2 model"""
-    global hunyuan_model
+    global hunyuan_model, gpu_available
 
     try:
         logger.info("🚀 Initializing Hunyuan3D-2 model...")
 
+        # Probe CUDA once here; health checks report the stored value
+        gpu_available = torch.cuda.is_available()
+
         # Check if running in demo mode (no GPU or model files)
-        if not torch.cuda.is_available():
+        if not gpu_available:
             logger.warning("⚠️ CUDA not available - running in demo mode")
             hunyuan_model = "demo_mode"
             return
@@ -96,9 +131,23 @@ def initialize_hunyuan3d():
         logger.info("✅ Hunyuan3D-2 service initialized successfully")
 
     except Exception as e:
-        logger.error(f"❌ Failed to initialize Hunyuan3D-2: {e}")
+        logger.error("❌ Failed to initialize Hunyuan3D-2: %s", e)
         hunyuan_model = "demo_mode"
 
+def load_upload_image(upload: UploadFile) -> Image.Image:
+    """Decode an uploaded image directly from its spooled file instead of copying it into memory"""
+    upload.file.seek(0)
+    return Image.open(upload.file).convert('RGB')
+
+def hash_upload(upload: UploadFile) -> str:
+    """Compute a blake2b digest of an upload by streaming its spooled file in chunks"""
+    digest = hashlib.blake2b(digest_size=16)
+    upload.file.seek(0)
+    while chunk := upload.file.read(UPLOAD_CHUNK_SIZE):
+        digest.update(chunk)
+    upload.file.seek(0)
+    return digest.hexdigest()
+
 def analyze_blueprint(image: Image.Image) -> Dict[str, Any]:
     """Analyze blueprint image to extract architectural elements"""
 
@@ -216,11 +265,12 @@ async def process_conversion_real(
 async def process_conversion_demo(
     image: Image.Image,
     params: ConversionRequest,
-    job_id: str
+    job_id: str,
+    content_hash: Optional[str] = None
 ) -> Dict[str, Any]:
     """Demo mode conversion simulation"""
 
-    logger.info(f"🎮 Running demo conversion for job {job_id}")
+    logger.info("🎮 Running demo conversion for job %s", job_id)
 
     # Simulate processing stages
     stages = [
@@ -237,34 +287,44 @@ async def process_conversion_demo(
         conversion_jobs[job_id]["message"] = message
         await asyncio.sleep(0.5)  # Simulate processing time
 
-    # Analyze the input image
-    analysis = analyze_blueprint(image)
-
-    conversion_jobs[job_id]["status"] = "completed"
-    conversion_jobs[job_id]["completed_at"] = datetime.now()
+    # Analyze the input image, reusing a prior /analyze result for the same upload
+    analysis = analysis_cache.get(content_hash) if content_hash else None
+    if analysis is None:
+        analysis = await run_in_threadpool(analyze_blueprint, image)
+        if content_hash:
+            add_to_analysis_cache(content_hash, analysis)
+
+    # Bind the nested lookups once; mesh_data and model_stats describe the same mesh
+    element_counts = analysis["element_counts"]
+    image_size = analysis["image_size"]
+    walls = element_counts["walls"]
+    mesh_stats = {
+        "vertices": walls * 1000 + np.random.randint(5000, 10000),
+        "faces": walls * 600 + np.random.randint(3000, 6000),
+        "materials": min(8, max(2, element_counts["rooms"]))
+    }
 
-    return {
+    result = {
         "model_url": f"/demo/models/{job_id}.obj",
         "texture_url": f"/demo/models/{job_id}_texture.jpg" if params.include_textures else None,
-        "mesh_data": {
-            "vertices": analysis["element_counts"]["walls"] * 1000 + np.random.randint(5000, 10000),
-            "faces": analysis["element_counts"]["walls"] * 600 + np.random.randint(3000, 6000),
-            "materials": min(8, max(2, analysis["element_counts"]["rooms"]))
-        },
-        "detected_elements": analysis["element_counts"],
+        "mesh_data": mesh_stats,
+        "detected_elements": element_counts,
         "building_metrics": {
-            "total_area": analysis["image_size"]["width"] * analysis["image_size"]["height"] // 100,
+            "total_area": image_size["width"] * image_size["height"] // 100,
             "height": np.random.randint(25, 45),
-            "estimated_cost": analysis["element_counts"]["walls"] * 50000 + np.random.randint(500000, 1000000)
+            "estimated_cost": walls * 50000 + np.random.randint(500000, 1000000)
         },
         "accuracy": np.random.randint(80, 90),  # Demo mode lower accuracy
-        "model_stats": {
-            "vertices": analysis["element_counts"]["walls"] * 1000 + np.random.randint(5000, 10000),
-            "faces": analysis["element_counts"]["walls"] * 600 + np.random.randint(3000, 6000),
-            "materials": min(8, max(2, analysis["element_counts"]["rooms"]))
-        }
+        "model_stats": dict(mesh_stats)
     }
 
+    # Store the result so /result serves it instead of the placeholder
+    conversion_jobs[job_id]["result"] = result
+    conversion_jobs[job_id]["status"] = "completed"
+    conversion_jobs[job_id]["completed_at"] = datetime.now()
+
+    return result
+
 # API Endpoints
 
 @app.get("/health")
@@ -274,7 +334,7 @@ async def health_check():
         "status": "healthy",
         "service": "hunyuan3d-service",
         "model_status": "loaded" if hunyuan_model != "demo_mode" else "demo_mode",
-        "gpu_available": torch.cuda.is_available(),
+        "gpu_available": gpu_available,
         "timestamp": datetime.now().isoformat()
     }
 
@@ -287,16 +347,23 @@ async def analyze_blueprint_endpoint(image: UploadFile = File(...)):
         if not image.content_type.startswith('image/'):
             raise HTTPException(status_code=400, detail="File must be an image")
 
-        # Load and analyze image
-        image_data = await image.read()
-        pil_image = Image.open(io.BytesIO(image_data)).convert('RGB')
+        # Hashing, decoding and OpenCV analysis are blocking, so keep them off the event loop
+        content_hash = await run_in_threadpool(hash_upload, image)
+        cached_analysis = analysis_cache.get(content_hash)
+        if cached_analysis:
+            analysis_cache.move_to_end(content_hash)
+            logger.info("Returning cached blueprint analysis (hash: %s...)", content_hash[:8])
+            return cached_analysis
 
-        analysis = analyze_blueprint(pil_image)
+        pil_image = await run_in_threadpool(load_upload_image, image)
+
+        analysis = await run_in_threadpool(analyze_blueprint, pil_image)
+        add_to_analysis_cache(content_hash, analysis)
 
         return analysis
 
     except Exception as e:
-        logger.error(f"Blueprint analysis failed: {e}")
+        logger.error("Blueprint analysis failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/generate3d")
@@ -317,7 +384,7 @@ async def generate_3d_model(
             raise HTTPException(status_code=400, detail="File must be an image")
 
         # Create job
-        job_id = str(uuid.uuid4())
+        job_id = uuid.uuid4().hex
         conversion_jobs[job_id] = {
             "status": "pending",
             "progress": 0.0,
@@ -327,8 +394,7 @@ async def generate_3d_model(
         }
 
         # Load image
-        image_data = await image.read()
-        pil_image = Image.open(io.BytesIO(image_data)).convert('RGB')
+        pil_image = await run_in_threadpool(load_upload_image, image)
 
         # Create conversion parameters
         params = ConversionRequest(
@@ -340,14 +406,16 @@ async def generate_3d_model(
 
         # Start background processing
         if hunyuan_model == "demo_mode":
-            background_tasks.add_task(process_conversion_demo, pil_image, params, job_id)
+            # The demo pipeline shares blueprint analyses with /analyze by upload hash
+            content_hash = await run_in_threadpool(hash_upload, image)
+            background_tasks.add_task(process_conversion_demo, pil_image, params, job_id, content_hash)
         else:
             background_tasks.add_task(process_conversion_real, pil_image, params, job_id)
 
         return {"job_id": job_id, "status": "started"}
 
     except Exception as e:
-        logger.error(f"3D generation failed: {e}")
+        logger.error("3D generation failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/status/{job_id}")
@@ -388,12 +456,15 @@ async def get_conversion_result(job_id: str):
     })
 
 @app.get("/formats")
-async def get_supported_formats():
+async def get_supported_formats(request: Request):
     """Get supported 3D model formats"""
-    return {
-        "formats": ["obj", "gltf", "glb", "ply", "fbx"],
-        "default": "obj"
-    }
+    headers = {"ETag": SUPPORTED_FORMATS_ETAG, "Cache-Control": "public, max-age=3600"}
+
+    # The format list never changes at runtime, so revalidating clients get a bodyless 304
+    if SUPPORTED_FORMATS_ETAG in request.headers.get("if-none-match", ""):
+        return Response(status_code=304, headers=headers)
+
+    return Response(content=SUPPORTED_FORMATS_BODY, media_type="application/json", headers=headers)
 
 # Startup event
 @app.on_event("startup")
@@ -405,7 +476,6 @@ async def startup_event():
 
 if __name__ == "__main__":
     import uvicorn
-    import io
 
     # Run the service
     uvicorn.run(